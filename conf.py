@@ -2,18 +2,45 @@
 """
 Centralized configuration management for Groq Whisperer.
 Prevents race conditions and provides a single source of truth for configuration.
+
+Mutations are serialized by a module lock and publish a new state dict, so
+readers can use the current state without locking.
 """
 
 import json
 import os
+import threading
+import types
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional dependency, fall back to stdlib json
+    orjson = None
 
 # Configuration file location
 CONFIG_FILE = Path(__file__).parent / "config.json"
 
-# Default configuration
-DEFAULT_CONFIG = {
+# In-memory cache of the parsed config, invalidated by the file's mtime
+_CACHE: Optional[Dict[str, Any]] = None
+_CACHE_MTIME: int = -1
+
+# Serializes read-modify-write cycles; readers only take a reference to _CACHE
+_LOCK = threading.RLock()
+
+# Nesting depth of batch() blocks, whether a write was deferred inside them,
+# and the state to restore if the deferred write fails
+_batch_depth: int = 0
+_batch_dirty: bool = False
+_batch_base: Optional[Dict[str, Any]] = None
+
+# Environment doesn't change within a process, so read the API key once
+_ENV_API_KEY: Optional[str] = os.environ.get("GROQ_API_KEY") or None
+
+# Default configuration (read-only; use dict(DEFAULT_CONFIG) for a writable copy)
+DEFAULT_CONFIG = types.MappingProxyType({
     "USE_VPN": True,
     "CHECK_VPN_CONNECTION": True,
     "TOGGLE_RECORDING_MODE": False,
@@ -26,55 +53,137 @@ DEFAULT_CONFIG = {
     "LOG_LEVEL": "INFO",
     "API_KEY": "",
     "ENABLE_LOGGING": True,
-}
+})
 
-def load() -> Dict[str, Any]:
-    """Load configuration from file with fallback to defaults."""
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(config: Dict[str, Any]) -> bytes:
+    """Serialize config to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode('utf-8')
+
+def _get_state() -> Dict[str, Any]:
+    """Return the shared in-memory config, re-reading the file only if it changed."""
+    global _CACHE, _CACHE_MTIME
     try:
-        if CONFIG_FILE.exists():
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                # Merge with defaults to ensure all keys are present
-                merged_config = DEFAULT_CONFIG.copy()
-                merged_config.update(config)
-                return merged_config
-        else:
-            # Create default config file
-            save(DEFAULT_CONFIG)
-            return DEFAULT_CONFIG.copy()
-    except Exception as e:
-        print(f"Warning: Failed to load config: {e}")
-        return DEFAULT_CONFIG.copy()
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
+        # Create default config file; the lock keeps concurrent readers off the shared temp file
+        with _LOCK:
+            if not CONFIG_FILE.exists():
+                _write(dict(DEFAULT_CONFIG))
+        return _CACHE if _CACHE is not None else dict(DEFAULT_CONFIG)
+    
+    if _CACHE is not None and mtime == _CACHE_MTIME:
+        return _CACHE
+    # Parse errors propagate so a corrupt file isn't silently replaced by defaults
+    config = _loads(CONFIG_FILE.read_bytes())
+    # Merge with defaults once per cache miss; later changes publish a new dict instead of mutating this one
+    _CACHE = {**DEFAULT_CONFIG, **config}
+    _CACHE_MTIME = mtime
+    return _CACHE
 
-def save(config: Dict[str, Any]) -> None:
-    """Save configuration to file with error handling."""
+def _write(state: Dict[str, Any]) -> bool:
+    """Write the full state to disk in one shot and make it the cached state."""
+    global _CACHE, _CACHE_MTIME
+    tmp_file = CONFIG_FILE.with_suffix('.json.tmp')
     try:
-        # Ensure we have all required keys
-        merged_config = DEFAULT_CONFIG.copy()
-        merged_config.update(config)
+        # Serialize first so an unserializable value never leaves a temp file behind
+        data = _dumps(state)
+        # Write to a sibling file and swap it in so readers never see a torn file
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, CONFIG_FILE)
         
-        # Write to file
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(merged_config, f, indent=2)
+        # Keep the cache warm so the next read doesn't re-parse the file
+        _CACHE = state
+        _CACHE_MTIME = os.stat(CONFIG_FILE).st_mtime_ns
+        return True
     except Exception as e:
         print(f"Warning: Failed to save config: {e}")
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+        return False
+
+def load() -> Dict[str, Any]:
+    """Load configuration from file with fallback to defaults."""
+    return _get_state().copy()
+
+def save(config: Dict[str, Any]) -> None:
+    """Save configuration to file with error handling."""
+    # Callers may pass a partial dict, so fill missing keys in the same copy
+    # that detaches the new state from the caller's object
+    with _LOCK:
+        _write({**DEFAULT_CONFIG, **config})
 
 def get(key: str, default: Any = None) -> Any:
     """Get a single configuration value."""
-    config = load()
-    return config.get(key, default)
+    state = _get_state()
+    return state.get(key, default)
+
+def __getattr__(name: str) -> Any:
+    """Resolve `conf.<KEY>` for DEFAULT_CONFIG keys (PEP 562).
+
+    Reads the published state without a stat call, so it reflects every change
+    made through this module; use get() to pick up external edits to the file.
+    """
+    if name not in DEFAULT_CONFIG:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    state = _CACHE if _CACHE is not None else _get_state()
+    return state[name]
+
+def _commit(state: Dict[str, Any]) -> None:
+    """Publish a new state, writing it now or at the end of the enclosing batch()."""
+    global _CACHE, _batch_dirty
+    if _batch_depth > 0:
+        # Published now so reads inside the batch see it; rolled back if the flush fails
+        _CACHE = state
+        _batch_dirty = True
+        return
+    # _write publishes the state only once it is on disk, so a failed save is dropped
+    _write(state)
 
 def set(key: str, value: Any) -> None:
     """Set a single configuration value."""
-    config = load()
-    config[key] = value
-    save(config)
+    with _LOCK:
+        state = dict(_get_state())
+        state[key] = value
+        _commit(state)
 
 def update(updates: Dict[str, Any]) -> None:
     """Update multiple configuration values."""
-    config = load()
-    config.update(updates)
-    save(config)
+    with _LOCK:
+        state = dict(_get_state())
+        state.update(updates)
+        _commit(state)
+
+@contextmanager
+def batch():
+    """Defer writes from set()/update() and flush them once when the block exits."""
+    global _CACHE, _batch_depth, _batch_dirty, _batch_base
+    with _LOCK:
+        if _batch_depth == 0:
+            _batch_base = _get_state()
+        _batch_depth += 1
+        try:
+            yield
+        finally:
+            _batch_depth -= 1
+            if _batch_depth == 0:
+                if _batch_dirty:
+                    _batch_dirty = False
+                    if not _write(_CACHE):
+                        _CACHE = _batch_base
+                _batch_base = None
 
 def reset() -> None:
     """Reset configuration to defaults."""
@@ -82,17 +191,8 @@ def reset() -> None:
 
 def get_api_key() -> str:
     """Get API key from environment variable or config file."""
-    # Check environment variable first
-    api_key = os.getenv("GROQ_API_KEY")
-    if api_key:
-        return api_key
-    
-    # Check config file
-    api_key = get("API_KEY", "")
-    if api_key:
-        return api_key
-    
-    return ""
+    # Environment variable wins and needs no file access
+    return _ENV_API_KEY or _get_state().get("API_KEY", "") or ""
 
 def ensure_api_key() -> str:
     """Ensure API key is available, prompt if necessary."""
@@ -8,36 +8,40 @@ unified configuration system.
 """
 
 import asyncio
+import atexit
 import configparser
+import ctypes
+import ctypes.wintypes
 import dataclasses
 import enum
+import functools
+import importlib.util
 import json
 import logging
+import logging.handlers
+import math
 import os
 import platform
+import queue
 import signal
+import struct
 import subprocess
 import sys
-import tempfile
+import threading
 import time
-import wave
 import winsound
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional, Tuple, List
+from typing import Any, ClassVar, Dict, Literal, Optional, Tuple, List
 
 import keyboard
 import numpy as np
-import pyaudio
-import pyautogui
-import pyperclip
-import webrtcvad
-from groq import Groq
 from rich.align import Align
 from rich.box import SQUARE
 from rich.console import Console
-
+from rich.layout import Layout
+from rich.live import Live
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
 from rich.prompt import Confirm
@@ -46,14 +50,75 @@ from rich.text import Text
 
 from rich import print as rp
 
+try:
+    import soxr
+except ImportError:  # Optional dependency, resampling falls back to scipy
+    soxr = None
+
+def _lazy_import(name: str):
+    """Returns a module that is only actually imported on first attribute access."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# Heavy imports deferred until first use: pyaudio starts PortAudio host APIs,
+# groq/httpx pull in pydantic, and none are needed to show the config UI
+groq = _lazy_import("groq")
+httpx = _lazy_import("httpx")
+pyaudio = _lazy_import("pyaudio")
+pyautogui = _lazy_import("pyautogui")
+pyperclip = _lazy_import("pyperclip")
+webrtcvad = _lazy_import("webrtcvad")
+
 # --- Constants ---
-CONFIG_FILE = Path(__file__).parent / "config.ini"
-LOGS_DIR = Path(__file__).parent / "logs"
+_BASE = Path(__file__).resolve().parent
+CONFIG_FILE = _BASE / "config.ini"
+LOGS_DIR = _BASE / "logs"
 TARGET_SAMPLE_RATE = 16000  # Whisper's optimal sample rate
-START_SOUND = Path(__file__).parent / "start_click_quiet.wav"
-COMPLETE_SOUND = Path(__file__).parent / "complete_chime_quiet.wav"
+RING_BUFFER_SECONDS = 2  # Captured audio the recording loop may lag behind before samples are dropped
+VAD_CHUNK_MS = 20  # VAD supports 10, 20, 30 ms
+QUIET_LEVEL_RATIO = 0.5  # Below this fraction of the noise threshold audio is "Too Quiet" and skips VAD
+PCM16_SAMPLE_SIZE = 2  # Bytes per 16-bit mono sample
+VAD_CHUNK_SAMPLES = TARGET_SAMPLE_RATE * VAD_CHUNK_MS // 1000  # 320
+VAD_CHUNK_BYTES = VAD_CHUNK_SAMPLES * PCM16_SAMPLE_SIZE  # 640
+START_SOUND = _BASE / "start_click_quiet.wav"
+COMPLETE_SOUND = _BASE / "complete_chime_quiet.wav"
 
 # --- Robust Logging Setup ---
+# Background listeners that own the real handlers, so logging calls on the
+# audio path only enqueue records instead of writing to disk; each entry also
+# keeps the logger and QueueHandler feeding it so they can be detached together
+_log_listeners: List[Tuple[logging.Logger, logging.Handler, logging.handlers.QueueListener]] = []
+
+def _stop_log_listeners():
+    """Detaches the queue handlers, flushes and stops their listeners, and closes the real handlers."""
+    while _log_listeners:
+        logger, queue_handler, listener = _log_listeners.pop()
+        # Detach first so nothing keeps filling a queue that is no longer read
+        logger.removeHandler(queue_handler)
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+atexit.register(_stop_log_listeners)
+
+def _attach_queue_listener(logger: logging.Logger, *handlers: logging.Handler):
+    """Routes a logger through a QueueHandler to a listener thread owning `handlers`."""
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _log_listeners.append((logger, queue_handler, listener))
+
 def setup_logging(session_logs: bool = True, console_level: str = "WARNING", file_level: str = "INFO"):
     """Sets up logging to file and console with separate log levels, and a global exception hook."""
     # Create logs directory if it doesn't exist
@@ -72,6 +137,7 @@ def setup_logging(session_logs: bool = True, console_level: str = "WARNING", fil
     file_log_level = level_map.get(file_level.upper(), logging.INFO)
     
     # Clear any existing handlers
+    _stop_log_listeners()
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
     
@@ -91,7 +157,6 @@ def setup_logging(session_logs: bool = True, console_level: str = "WARNING", fil
         file_handler.setFormatter(logging.Formatter(
             "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
         ))
-        app_logger.addHandler(file_handler)
         
         # Console handler with separate level
         console_handler = logging.StreamHandler(sys.stdout)
@@ -99,7 +164,7 @@ def setup_logging(session_logs: bool = True, console_level: str = "WARNING", fil
         console_handler.setFormatter(logging.Formatter(
             "%(asctime)s [%(levelname)s]: %(message)s"
         ))
-        app_logger.addHandler(console_handler)
+        _attach_queue_listener(app_logger, file_handler, console_handler)
         
         # Chat log for transcriptions (file only, no console output)
         chat_logger = logging.getLogger("chat")
@@ -109,7 +174,7 @@ def setup_logging(session_logs: bool = True, console_level: str = "WARNING", fil
         chat_handler.setFormatter(logging.Formatter(
             "%(asctime)s: %(message)s"
         ))
-        chat_logger.addHandler(chat_handler)
+        _attach_queue_listener(chat_logger, chat_handler)
         # Prevent chat logs from going to console
         chat_logger.propagate = False
         
@@ -162,6 +227,7 @@ class VPNError(Exception):
     pass
 
 # --- Core Configuration (Single Source of Truth) ---
+@functools.lru_cache(maxsize=1)
 def find_openvpn_exe() -> Optional[str]:
     """Attempt to find the OpenVPN executable in common locations."""
     for path_str in [
@@ -201,6 +267,15 @@ class Config:
     enable_sounds: bool = True
     enable_session_logging: bool = True
 
+    # INI layout: section name -> keys stored in that section
+    _SECTIONS: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        'VPN': ('use_vpn', 'check_vpn_connection', 'vpn_verbose', 'ovpn_path', 'openvpn_exe'),
+        'Recording': ('toggle_recording_mode', 'auto_paste', 'max_recording_duration',
+                      'min_recording_duration', 'noise_threshold', 'vad_aggressiveness'),
+        'Interface': ('verbose_output', 'console_log_level', 'file_log_level',
+                      'enable_sounds', 'enable_session_logging'),
+    }
+
     @classmethod
     def load(cls) -> "Config":
         """
@@ -234,19 +309,22 @@ class Config:
             loaded_data = {}
             
             # Load from INI sections
-            for section_name in config_parser.sections():
-                for key, value in config_parser.items(section_name):
-                    if key in defaults:
-                        # Convert string values to appropriate types
-                        default_type = type(defaults[key])
-                        if default_type == bool:
-                            loaded_data[key] = config_parser.getboolean(section_name, key)
-                        elif default_type == float:
-                            loaded_data[key] = config_parser.getfloat(section_name, key)
-                        elif default_type == int:
-                            loaded_data[key] = config_parser.getint(section_name, key)
-                        else:
-                            loaded_data[key] = value
+            for section_name, keys in cls._SECTIONS.items():
+                if not config_parser.has_section(section_name):
+                    continue
+                for key in keys:
+                    if not config_parser.has_option(section_name, key):
+                        continue
+                    # Convert string values to appropriate types
+                    field_type = _CONFIG_FIELD_TYPES[key]
+                    if field_type is bool:
+                        loaded_data[key] = config_parser.getboolean(section_name, key)
+                    elif field_type is float:
+                        loaded_data[key] = config_parser.getfloat(section_name, key)
+                    elif field_type is int:
+                        loaded_data[key] = config_parser.getint(section_name, key)
+                    else:
+                        loaded_data[key] = config_parser.get(section_name, key)
             
             # Merge with defaults
             final_config_data = {**defaults, **loaded_data}
@@ -283,27 +361,10 @@ class Config:
         data = dataclasses.asdict(self)
         
         # Group settings into logical sections
-        config_parser.add_section('VPN')
-        config_parser.set('VPN', 'use_vpn', str(data['use_vpn']))
-        config_parser.set('VPN', 'check_vpn_connection', str(data['check_vpn_connection']))
-        config_parser.set('VPN', 'vpn_verbose', str(data['vpn_verbose']))
-        config_parser.set('VPN', 'ovpn_path', data['ovpn_path'])
-        config_parser.set('VPN', 'openvpn_exe', data['openvpn_exe'])
-        
-        config_parser.add_section('Recording')
-        config_parser.set('Recording', 'toggle_recording_mode', str(data['toggle_recording_mode']))
-        config_parser.set('Recording', 'auto_paste', str(data['auto_paste']))
-        config_parser.set('Recording', 'max_recording_duration', str(data['max_recording_duration']))
-        config_parser.set('Recording', 'min_recording_duration', str(data['min_recording_duration']))
-        config_parser.set('Recording', 'noise_threshold', str(data['noise_threshold']))
-        config_parser.set('Recording', 'vad_aggressiveness', str(data['vad_aggressiveness']))
-        
-        config_parser.add_section('Interface')
-        config_parser.set('Interface', 'verbose_output', str(data['verbose_output']))
-        config_parser.set('Interface', 'console_log_level', data['console_log_level'])
-        config_parser.set('Interface', 'file_log_level', data['file_log_level'])
-        config_parser.set('Interface', 'enable_sounds', str(data['enable_sounds']))
-        config_parser.set('Interface', 'enable_session_logging', str(data['enable_session_logging']))
+        config_parser.read_dict({
+            section: {key: str(data[key]) for key in keys}
+            for section, keys in self._SECTIONS.items()
+        })
         
         try:
             with open(CONFIG_FILE, 'w') as f:
@@ -311,64 +372,148 @@ class Config:
         except Exception as e:
             logging.error(f"Error saving config: {e}")
 
+# Field name -> declared type, used to coerce INI strings on load
+_CONFIG_FIELD_TYPES: Dict[str, type] = {f.name: f.type for f in dataclasses.fields(Config)}
+
 # --- UI Components ---
 class AudioLevelVisualizer:
     """Enhanced audio level visualizer with explicit feedback."""
     
     def __init__(self, bar_width: int = 40):
         self.bar_width = bar_width
-        self.peak_level = 0.0
-        self.peak_decay = 0.95
+        self.peak_cell = 0  # Peak indicator position in bar cells, decays one cell per frame
+        self._set_thresholds(0)
+        # Rendered bars keyed by (filled_width, peak_pos); at most (bar_width + 1) ** 2 entries
+        self._bar_cache: Dict[Tuple[int, int], str] = {}
+
+    @staticmethod
+    def compute_level(raw_bytes: bytes, scratch: Optional[np.ndarray] = None) -> float:
+        """Computes the mean absolute amplitude of a chunk of 16-bit PCM audio."""
+        # frombuffer gives a zero-copy view over the captured bytes
+        samples = np.frombuffer(raw_bytes, dtype=np.int16)
+        if not samples.size:
+            return 0.0
+        # abs is taken in int32 so -32768 doesn't wrap, then summed in a single integer pass
+        if scratch is None:
+            out = np.abs(samples, dtype=np.int32)
+        else:
+            # Reuse the caller's buffer for the abs values instead of allocating one
+            out = np.abs(samples, out=scratch[:samples.size], dtype=np.int32)
+        return int(np.add.reduce(out, dtype=np.int64)) / samples.size
+
+    _FEEDBACK_QUIET = ("Too Quiet", "blue")
+    _FEEDBACK_GOOD = ("Good", "green")
+    _FEEDBACK_HIGH = ("Good", "yellow")
+    _FEEDBACK_LOUD = ("Too Loud!", "red")
+
+    def _set_thresholds(self, threshold: float):
+        """Precomputes the feedback boundaries; the threshold only changes on calibration."""
+        self._threshold = threshold
+        self._t_quiet = threshold * QUIET_LEVEL_RATIO
+        self._t_high = threshold * 1.5
+        self._t_loud = threshold * 3
 
     def get_level_feedback(self, level: float, threshold: float) -> Tuple[str, str]:
         """Provides explicit feedback on audio levels."""
-        if level < threshold * 0.5:
-            return "Too Quiet", "blue"
-        if level > threshold * 3:
-            return "Too Loud!", "red"
-        if level > threshold * 1.5:
-            return "Good", "yellow"
-        return "Good", "green"
-
-    def render(self, level: float, threshold: float) -> str:
+        if threshold != self._threshold:
+            self._set_thresholds(threshold)
+        if level < self._t_quiet:
+            return self._FEEDBACK_QUIET
+        if level > self._t_loud:
+            return self._FEEDBACK_LOUD
+        if level > self._t_high:
+            return self._FEEDBACK_HIGH
+        return self._FEEDBACK_GOOD
+
+    def _get_bar(self, filled_width: int, peak_pos: int) -> str:
+        """Returns the bar string for a fill/peak pair, building it on first use."""
+        key = (filled_width, peak_pos)
+        bar = self._bar_cache.get(key)
+        if bar is None:
+            # Create the bar without Rich markup to avoid conflicts
+            bar = "█" * filled_width + " " * (self.bar_width - filled_width)
+            
+            # Add peak indicator if applicable
+            if 0 < peak_pos <= self.bar_width:
+                bar = bar[:peak_pos - 1] + "┃" + bar[peak_pos:]
+            self._bar_cache[key] = bar
+        return bar
+
+    def render(self, level: float, threshold: int) -> str:
         """Creates the visualizer string."""
-        # Normalize level for the bar
-        max_level = threshold * 4
-        normalized = min(1.0, level / max_level)
+        level = int(level)
+        
+        # Scale so that 4x the threshold fills the bar, using integer math only
+        filled_width = level * self.bar_width // max(1, threshold * 4)
+        if filled_width > self.bar_width:
+            filled_width = self.bar_width
         
         # Update peak with decay
-        if normalized > self.peak_level:
-            self.peak_level = normalized
-        else:
-            self.peak_level *= self.peak_decay
-            
-        filled_width = int(normalized * self.bar_width)
+        self.peak_cell = filled_width if filled_width > self.peak_cell else max(0, self.peak_cell - 1)
         
         feedback, color = self.get_level_feedback(level, threshold)
         
-        # Create the bar without Rich markup to avoid conflicts
-        filled_part = "█" * filled_width
-        empty_part = " " * (self.bar_width - filled_width)
-        bar = filled_part + empty_part
-        
-        # Add peak indicator if applicable
-        peak_pos = int(self.peak_level * self.bar_width)
-        if 0 < peak_pos <= self.bar_width:
-            bar_list = list(bar)
-            if peak_pos - 1 < len(bar_list):
-                bar_list[peak_pos - 1] = "┃"
-            bar = "".join(bar_list)
+        bar = self._get_bar(filled_width, self.peak_cell)
         
         # Return plain text without Rich markup to prevent conflicts
-        return f"Level: {int(level):<5} |{bar}| {feedback}"
+        return f"Level: {level:<5} |{bar}| {feedback}"
 
 class SettingsUI:
     """Manages the interactive configuration panel."""
 
+    # Menu structure with categories
+    _MENU_STRUCTURE: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        # VPN Section
+        ("🔒 VPN SETTINGS", "header"),
+        ("Toggle VPN Usage", "use_vpn"),
+        ("Toggle VPN Verbose", "vpn_verbose"),
+        ("Toggle VPN Connection Check", "check_vpn_connection"),
+        ("", "divider"),
+        
+        # Recording Section  
+        ("🎙️ RECORDING SETTINGS", "header"),
+        ("Toggle Recording Mode", "toggle_recording_mode"),
+        ("Toggle Auto-paste", "auto_paste"),
+        ("Set Max Recording Duration", "max_recording_duration"),
+        ("Set Min Recording Duration", "min_recording_duration"),
+        ("Set Noise Threshold", "noise_threshold"),
+        ("Set VAD Aggressiveness", "vad_aggressiveness"),
+        ("", "divider"),
+        
+        # Interface Section
+        ("🖥️ INTERFACE SETTINGS", "header"),
+        ("Toggle Verbose Output", "verbose_output"),
+        ("Toggle Sounds", "enable_sounds"),
+        ("Toggle Session Logging", "enable_session_logging"),
+        ("Cycle Console Log Level", "console_log_level"),
+        ("Cycle File Log Level", "file_log_level"),
+        ("", "divider"),
+        
+        # Actions Section
+        ("⚙️ ACTIONS", "header"),
+        ("Run Network Tests", "network_test"),
+        ("Calibrate Microphone", "calibrate_mic"),
+        ("", "divider"),
+        
+        # Main Actions
+        ("🚀 START APPLICATION", "start"),
+        ("❌ QUIT", "quit"),
+    )
+    # Selectable actions in display order, and each one's row in _MENU_STRUCTURE
+    _MENU_ITEMS: ClassVar[Tuple[str, ...]] = tuple(
+        action for _, action in _MENU_STRUCTURE if action not in ("header", "divider")
+    )
+    _ITEM_TO_STRUCT: ClassVar[Tuple[int, ...]] = tuple(
+        i for i, (_, action) in enumerate(_MENU_STRUCTURE) if action not in ("header", "divider")
+    )
+    # Fewest menu rows to keep before the banner is hidden to make room
+    _MIN_MENU_ROWS: ClassVar[int] = 16
+
     def __init__(self, console: Console, config: Config, app: "WhispererApp"):
         self.console = console
         self.config = config
         self.app = app
+        self._field_names = tuple(f.name for f in dataclasses.fields(config))
         self.settings_info = {
             "use_vpn": "Enable VPN for secure connection",
             "check_vpn_connection": "Verify VPN connectivity before start",
@@ -424,8 +569,6 @@ class SettingsUI:
         text.append("─" * 80, style="dim cyan")
         text.append("\n", style="")
         
-        config_dict = dataclasses.asdict(self.config)
-        
         # Show only the most important settings in compact form
         important_settings = [
             ("Use VPN", "use_vpn"),
@@ -438,8 +581,8 @@ class SettingsUI:
         ]
         
         for display_name, key in important_settings:
-            if key in config_dict:
-                value = config_dict[key]
+            if key in self._field_names:
+                value = getattr(self.config, key)
                 desc = self.settings_info.get(key, "")
                 
                 if isinstance(value, bool):
@@ -463,169 +606,145 @@ class SettingsUI:
         
         return text
 
-    def _create_menu_options(self, selected_index: int) -> Text:
+    def _create_menu_options(self, selected_index: int, max_rows: Optional[int] = None) -> Text:
         """Creates the menu with horizontal dividers and background highlights."""
-        # Menu structure with categories
-        menu_structure = [
-            # VPN Section
-            ("🔒 VPN SETTINGS", "header"),
-            ("Toggle VPN Usage", "use_vpn"),
-            ("Toggle VPN Verbose", "vpn_verbose"),
-            ("Toggle VPN Connection Check", "check_vpn_connection"),
-            ("", "divider"),
-            
-            # Recording Section  
-            ("🎙️ RECORDING SETTINGS", "header"),
-            ("Toggle Recording Mode", "toggle_recording_mode"),
-            ("Toggle Auto-paste", "auto_paste"),
-            ("Set Max Recording Duration", "max_recording_duration"),
-            ("Set Min Recording Duration", "min_recording_duration"),
-            ("Set Noise Threshold", "noise_threshold"),
-            ("Set VAD Aggressiveness", "vad_aggressiveness"),
-            ("", "divider"),
-            
-            # Interface Section
-            ("🖥️ INTERFACE SETTINGS", "header"),
-            ("Toggle Verbose Output", "verbose_output"),
-            ("Toggle Sounds", "enable_sounds"),
-            ("Toggle Session Logging", "enable_session_logging"),
-            ("Cycle Console Log Level", "console_log_level"),
-            ("Cycle File Log Level", "file_log_level"),
-            ("", "divider"),
-            
-            # Actions Section
-            ("⚙️ ACTIONS", "header"),
-            ("Run Network Tests", "network_test"),
-            ("Calibrate Microphone", "calibrate_mic"),
-            ("", "divider"),
-            
-            # Main Actions
-            ("🚀 START APPLICATION", "start"),
-            ("❌ QUIT", "quit")
-        ]
+        actual_selected = self._ITEM_TO_STRUCT[selected_index]
         
-        # Get the menu items (non-headers/dividers only) - must match show() method exactly
-        menu_items = [
-            "use_vpn", "vpn_verbose", "check_vpn_connection",
-            "toggle_recording_mode", "auto_paste", "max_recording_duration",
-            "min_recording_duration", "noise_threshold", "vad_aggressiveness",
-            "verbose_output", "enable_sounds", "enable_session_logging",
-            "console_log_level", "file_log_level", "network_test", "calibrate_mic",
-            "start", "quit"
-        ]
-        
-        # Find the actual selected menu item index
-        actual_selected = 0
-        menu_item_index = 0
-        for i, (label, action) in enumerate(menu_structure):
-            if action not in ["header", "divider"]:
-                if menu_item_index == selected_index:
-                    actual_selected = i
-                    break
-                menu_item_index += 1
-        
-        text = Text()
-        for i, (label, action) in enumerate(menu_structure):
+        lines: List[Text] = []
+        selected_line = 0
+        for i, (label, action) in enumerate(self._MENU_STRUCTURE):
             if action == "header":
                 # Category header with background highlight
-                text.append(f"\n {label} ", style="bold white on blue")
-                text.append("\n")
+                lines.append(Text(""))
+                lines.append(Text(f" {label} ", style="bold white on blue"))
             elif action == "divider":
                 # Horizontal divider
-                text.append("─" * 60, style="dim cyan")
-                text.append("\n")
+                lines.append(Text("─" * 60, style="dim cyan"))
             else:
                 # Menu item
                 if i == actual_selected:
                     # Selected item with full background highlight
-                    text.append(f" ▶ {label} ", style="bold black on green")
+                    selected_line = len(lines)
+                    lines.append(Text(f" ▶ {label} ", style="bold black on green"))
                 else:
                     # Normal menu item
-                    text.append(f"   {label}", style="white")
-                text.append("\n")
+                    lines.append(Text(f"   {label}", style="white"))
+        
+        # Scroll so the selected item stays visible when the menu is taller than its region
+        if max_rows is not None and len(lines) > max_rows:
+            max_rows = max(max_rows, 3)
+            first = min(max(selected_line - max_rows // 2, 0), len(lines) - max_rows)
+            window = lines[first:first + max_rows]
+            if first > 0:
+                window[0] = Text("   ▲ more", style="dim cyan")
+            if first + max_rows < len(lines):
+                window[-1] = Text("   ▼ more", style="dim cyan")
+            lines = window
         
+        text = Text("\n").join(lines)
+        text.append("\n")
         return text
 
+    def _fit_layout(self, layout: Layout) -> int:
+        """Hides the banner on short terminals and returns the rows left for the menu."""
+        height = self.console.size.height
+        header_rows = layout["header"].size
+        settings_rows = layout["settings"].size
+        # The menu matters more than the banner, so drop the banner before squeezing the menu
+        layout["header"].visible = height - header_rows - settings_rows >= self._MIN_MENU_ROWS
+        if layout["header"].visible:
+            return height - header_rows - settings_rows
+        return height - settings_rows
+
     async def show(self) -> bool:
         """Displays the interactive settings panel."""
         if not sys.stdout.isatty():
             return True  # Skip interactive config in non-TTY environments
 
-        # Menu items that match the new structure exactly
-        menu_items = [
-            "use_vpn", "vpn_verbose", "check_vpn_connection",
-            "toggle_recording_mode", "auto_paste", "max_recording_duration",
-            "min_recording_duration", "noise_threshold", "vad_aggressiveness",
-            "verbose_output", "enable_sounds", "enable_session_logging",
-            "console_log_level", "file_log_level", "network_test", "calibrate_mic",
-            "start", "quit"
-        ]
+        menu_items = self._MENU_ITEMS
         selected_index = menu_items.index("start")
 
         # Initial display
-        self._display_menu(selected_index)
+        layout = self._create_layout(selected_index)
         
-        while True:
-            event = await asyncio.to_thread(keyboard.read_event)
-            if event.event_type != keyboard.KEY_DOWN:
-                continue
-
-            needs_update = False
-            
-            if event.name == "down":
-                selected_index = (selected_index + 1) % len(menu_items)
-                needs_update = True
-            elif event.name == "up":
-                selected_index = (selected_index - 1 + len(menu_items)) % len(menu_items)
-                needs_update = True
-            elif event.name == "enter":
-                action = menu_items[selected_index]
+        # Key events come from the app-wide keyboard hook rather than a thread per read
+        async with self.app.capture_key_events() as key_events:
+            # Repaint only on change instead of clearing and reprinting the whole screen
+            with Live(layout, console=self.console, auto_refresh=False, screen=True) as live:
+                while True:
+                    event = await key_events.get()
+                    if event.event_type != keyboard.KEY_DOWN:
+                        continue
+
+                    menu_changed = False
+                    settings_changed = False
                 
-                if action == "start": return True
-                if action == "quit": return False
+                    if event.name == "down":
+                        selected_index = (selected_index + 1) % len(menu_items)
+                        menu_changed = True
+                    elif event.name == "up":
+                        selected_index = (selected_index - 1 + len(menu_items)) % len(menu_items)
+                        menu_changed = True
+                    elif event.name == "enter":
+                        action = menu_items[selected_index]
+                    
+                        if action == "start": return True
+                        if action == "quit": return False
+                    
+                        # Handle boolean toggles
+                        if ("toggle" in action or action in ["use_vpn", "enable_sounds", "enable_session_logging", 
+                                                            "vpn_verbose", "check_vpn_connection", "verbose_output"]):
+                            setattr(self.config, action, not getattr(self.config, action))
+                            self.config.save()
+                            settings_changed = True
+                        # Handle log level cycling
+                        elif action in ["console_log_level", "file_log_level"]:
+                            await self._cycle_log_level(action)
+                            settings_changed = True
+                        # Handle numeric settings (prompts need the normal screen)
+                        elif action in ["max_recording_duration", "min_recording_duration", "noise_threshold", "vad_aggressiveness"]:
+                            live.stop()
+                            await self._set_numeric_value(action)
+                            self.app.discard_key_events()
+                            live.start()
+                            settings_changed = True
+                        # Handle special actions
+                        elif hasattr(self, f"_action_{action}"):
+                            live.stop()
+                            await getattr(self, f"_action_{action}")()
+                            self.app.discard_key_events()
+                            live.start()
+                            settings_changed = True
+
+                    elif event.name in ["q", "esc"]:
+                        return False
                 
-                # Handle boolean toggles
-                if ("toggle" in action or action in ["use_vpn", "enable_sounds", "enable_session_logging", 
-                                                    "vpn_verbose", "check_vpn_connection", "verbose_output"]):
-                    setattr(self.config, action, not getattr(self.config, action))
-                    self.config.save()
-                    needs_update = True
-                # Handle log level cycling
-                elif action in ["console_log_level", "file_log_level"]:
-                    await self._cycle_log_level(action)
-                    needs_update = True
-                # Handle numeric settings
-                elif action in ["max_recording_duration", "min_recording_duration", "noise_threshold", "vad_aggressiveness"]:
-                    await self._set_numeric_value(action)
-                    needs_update = True
-                # Handle special actions
-                elif hasattr(self, f"_action_{action}"):
-                    await getattr(self, f"_action_{action}")()
-                    needs_update = True
-
-            elif event.name in ["q", "esc"]:
-                return False
-            
-            # Update display if something changed
-            if needs_update:
-                self._display_menu(selected_index)
-
-    def _display_menu(self, selected_index: int):
-        """Display the menu with proper clearing to prevent scroll issues."""
-        # Clear screen properly for Windows
-        self.console.clear()
-        
-        # Show header
+                    # Update only the regions that changed
+                    if settings_changed:
+                        layout["settings"].update(self._create_settings_table())
+                    if menu_changed or settings_changed:
+                        # Also refits the menu in case the terminal was resized
+                        self._update_menu(layout, selected_index)
+                    if settings_changed or menu_changed:
+                        live.refresh()
+
+    def _create_layout(self, selected_index: int) -> Layout:
+        """Builds the menu screen as header, settings and menu regions."""
         header_text = self._create_welcome_panel()
-        self.console.print(header_text)
-        
-        # Show settings
         settings_text = self._create_settings_table()
-        self.console.print(settings_text)
         
-        # Show menu
-        menu_text = self._create_menu_options(selected_index)
-        self.console.print(menu_text)
+        layout = Layout(name="root")
+        layout.split_column(
+            Layout(header_text, name="header", size=header_text.plain.count("\n") + 1),
+            Layout(settings_text, name="settings", size=settings_text.plain.count("\n") + 1),
+            Layout(name="menu"),
+        )
+        self._update_menu(layout, selected_index)
+        return layout
+
+    def _update_menu(self, layout: Layout, selected_index: int):
+        """Redraws the menu region, scrolled to fit the current terminal height."""
+        layout["menu"].update(self._create_menu_options(selected_index, self._fit_layout(layout)))
 
     async def _action_network_test(self):
         """Action to run network connectivity tests."""
@@ -697,38 +816,132 @@ class SettingsUI:
         
         await asyncio.sleep(2)
 
+# WAV bytes read once, so playing a sound doesn't touch the disk
+_SOUND_CACHE: Dict[Path, bytes] = {
+    p: p.read_bytes() for p in (START_SOUND, COMPLETE_SOUND) if p.exists()
+}
+
+# Fallback beep (frequency Hz, duration ms) per sound when WAV playback isn't possible
+_BEEP: Dict[Path, Tuple[int, int]] = {
+    START_SOUND: (1000, 150),
+    COMPLETE_SOUND: (800, 150),
+}
+
+def _beep(sound_file: Path):
+    """Plays the fallback beep for a sound."""
+    freq, dur = _BEEP.get(sound_file, (800, 150))
+    try:
+        winsound.Beep(freq, dur)
+    except Exception:
+        pass  # Silent failure for sounds
+
+def _play_wav_bytes(sound_file: Path, data: bytes):
+    """Plays in-memory WAV data, falling back to a system beep."""
+    try:
+        winsound.PlaySound(data, winsound.SND_MEMORY)
+    except Exception as e:
+        logging.debug(f"WAV playback failed: {e}")
+        # Fallback to system beep if file playback fails
+        _beep(sound_file)
+
 def play_sound(sound_file: Path, enabled: bool = True):
     """Play a sound file if sounds are enabled and file exists."""
     if not enabled:
         return
     
-    if not sound_file.exists():
-        logging.debug(f"Sound file not found: {sound_file}")
-        # Use system beep as fallback
-        try:
-            if "start" in str(sound_file).lower():
-                winsound.Beep(1000, 150)
-            else:
-                winsound.Beep(800, 150)
-        except Exception:
-            pass
-        return
+    data = _SOUND_CACHE.get(sound_file)
+    if data is None:
+        if not sound_file.exists():
+            logging.debug(f"Sound file not found: {sound_file}")
+            # Use system beep as fallback
+            _beep(sound_file)
+            return
+        data = _SOUND_CACHE[sound_file] = sound_file.read_bytes()
     
+    # winsound can't play SND_MEMORY with SND_ASYNC, so play on a worker thread
+    # to return to the recording loop immediately
+    threading.Thread(target=_play_wav_bytes, args=(sound_file, data), daemon=True).start()
+
+# --- Audio Processing ---
+# Shared across AudioProcessor instances so re-initializing audio doesn't
+# rebuild VAD state or restart the PortAudio host APIs
+_VAD_CACHE: Dict[int, "webrtcvad.Vad"] = {}
+_PYAUDIO: Optional["pyaudio.PyAudio"] = None
+
+def _terminate_pyaudio():
+    """Releases the shared PyAudio instance."""
+    global _PYAUDIO
     try:
-        # Try synchronous playback first for reliability
-        winsound.PlaySound(str(sound_file), winsound.SND_FILENAME)
+        if _PYAUDIO is not None:
+            _PYAUDIO.terminate()
     except Exception as e:
-        logging.debug(f"WAV playback failed: {e}")
-        # Fallback to system beep if file playback fails
+        logging.debug(f"Error terminating PyAudio: {e}")
+    finally:
+        _PYAUDIO = None
+
+class StreamResampler:
+    """Resamples a continuous 16-bit mono stream to TARGET_SAMPLE_RATE, keeping filter state across chunks."""
+
+    def __init__(self, source_rate: int):
+        self.source_rate = source_rate
+        self._stream = None
+        if soxr is not None:
+            self._stream = soxr.ResampleStream(source_rate, TARGET_SAMPLE_RATE, 1, dtype="int16", quality="HQ")
+            return
         try:
-            if "start" in str(sound_file).lower():
-                winsound.Beep(1000, 150)  # Start recording beep
-            else:
-                winsound.Beep(800, 150)   # Complete beep
-        except Exception:
-            pass  # Silent failure for sounds
+            from scipy.signal import resample_poly
+        except ImportError as e:
+            raise AudioProcessingError(
+                f"Resampling from {source_rate} Hz requires 'soxr' or 'scipy': {e}"
+            )
+        # scipy has no streaming resampler, so overlap the input and only emit outputs
+        # whose filter support is complete (resample_poly's half-length is 10 * max(up, down))
+        self._resample_poly = resample_poly
+        divisor = math.gcd(TARGET_SAMPLE_RATE, source_rate)
+        self._up = TARGET_SAMPLE_RATE // divisor
+        self._down = source_rate // divisor
+        self._margin = -(-10 * max(self._up, self._down) // self._up) + 1  # In input samples
+        self._history = np.zeros(0, dtype=np.float32)
+        self._history_start = 0  # Stream index of _history[0], always a multiple of _down
+        self._next_out = 0  # Stream index of the next output sample to emit
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Feeds int16 samples and returns the int16 output ready so far; its length varies per call."""
+        if self._stream is not None:
+            return self._stream.resample_chunk(samples)
+        
+        up, down, margin = self._up, self._down, self._margin
+        buffer = np.concatenate((self._history, samples.astype(np.float32)))
+        start = self._history_start
+        last_out = (start + len(buffer) - margin) * up // down
+        if last_out < self._next_out:
+            self._history = buffer
+            return np.zeros(0, dtype=np.int16)
+        
+        # With `start` a multiple of `down`, output k of the buffer is stream output start*up/down + k
+        base = start // down * up
+        resampled = self._resample_poly(buffer, up, down)[self._next_out - base:last_out + 1 - base]
+        self._next_out = last_out + 1
+        
+        # Keep enough input for the left edge of the next outputs' filter support
+        keep_from = max(start, (self._next_out * down // up - margin) // down * down)
+        self._history = buffer[keep_from - start:]
+        self._history_start = keep_from
+        return np.clip(resampled, -32768, 32767).astype(np.int16)
+
+WAV_HEADER_SIZE = 44
+
+def pack_wav_header(buffer: bytearray, data_size: int, sample_rate: int):
+    """Writes a 16-bit mono PCM WAV header for `data_size` bytes of audio at the start of `buffer`."""
+    channels, sample_width = 1, PCM16_SAMPLE_SIZE
+    struct.pack_into(
+        "<4sI4s4sIHHIIHH4sI", buffer, 0,
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate,
+        sample_rate * channels * sample_width, channels * sample_width, sample_width * 8,
+        b"data", data_size
+    )
 
-# --- Audio Processing ---
 class AudioProcessor:
     """Handles all audio recording, VAD, and processing."""
 
@@ -737,15 +950,39 @@ class AudioProcessor:
         self.console = Console(width=120)
         self.visualizer = AudioLevelVisualizer()
         self._pyaudio = self._initialize_pyaudio_with_retry()
-        self.vad = webrtcvad.Vad(self.config.vad_aggressiveness)
+        self.vad = _VAD_CACHE.get(self.config.vad_aggressiveness)
+        if self.vad is None:
+            self.vad = _VAD_CACHE[self.config.vad_aggressiveness] = webrtcvad.Vad(self.config.vad_aggressiveness)
         self.input_device_index = self._pyaudio.get_default_input_device_info()["index"]
+        # Rate the microphone is opened at; audio is resampled to TARGET_SAMPLE_RATE if it differs
+        self.capture_rate = self._select_capture_rate()
+        # Samples per VAD chunk at the capture rate; equals VAD_CHUNK_SAMPLES when no resampling is needed
+        self._chunk_size = self.capture_rate * VAD_CHUNK_MS // 1000
+        self._ring = np.zeros(0, dtype=np.int16)
+        self._ring_write = 0  # Total samples written by the stream callback
+        # Set from the callback thread whenever new samples land in the ring
+        self._audio_ready = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stream: Optional["pyaudio.Stream"] = None
+        self._armed = False  # True while record() is consuming audio from the ring
+        # Reused by compute_level; 20 ms at the higher rate fits every chunk size used here
+        self._level_scratch = np.empty(max(self.capture_rate, TARGET_SAMPLE_RATE) // 50, dtype=np.int32)
+        # Set whenever no recording is in progress; background work waits on it before pasting
+        self.capture_idle = asyncio.Event()
+        self.capture_idle.set()
         self.chat_logger = logging.getLogger("chat")
 
-    def _initialize_pyaudio_with_retry(self) -> pyaudio.PyAudio:
+    def _initialize_pyaudio_with_retry(self) -> "pyaudio.PyAudio":
         """Initialize PyAudio with retry logic for better reliability."""
+        global _PYAUDIO
+        if _PYAUDIO is not None:
+            return _PYAUDIO
+        
         for attempt in range(2):  # Try twice
             try:
-                return pyaudio.PyAudio()
+                _PYAUDIO = pyaudio.PyAudio()
+                atexit.register(_terminate_pyaudio)
+                return _PYAUDIO
             except Exception as e:
                 if attempt == 0:
                     logging.warning(f"PyAudio initialization failed on first try: {e}. Retrying in 1 second...")
@@ -757,6 +994,24 @@ class AudioProcessor:
         # This should never be reached, but just in case
         raise AudioProcessingError("Failed to initialize audio system")
 
+    def _select_capture_rate(self) -> int:
+        """Prefers capturing at TARGET_SAMPLE_RATE so no resampling is needed."""
+        try:
+            self._pyaudio.is_format_supported(
+                TARGET_SAMPLE_RATE, input_device=self.input_device_index,
+                input_channels=1, input_format=pyaudio.paInt16
+            )
+            return TARGET_SAMPLE_RATE
+        except Exception as e:
+            try:
+                device_info = self._pyaudio.get_device_info_by_index(self.input_device_index)
+                native_rate = int(device_info["defaultSampleRate"])
+            except Exception as info_error:
+                logging.warning(f"Could not read input device sample rate: {info_error}")
+                return TARGET_SAMPLE_RATE
+            logging.info(f"Input device doesn't support {TARGET_SAMPLE_RATE} Hz ({e}), capturing at {native_rate} Hz and resampling")
+            return native_rate
+
     async def calibrate(self):
         """Auto-calibrates the noise threshold."""
         self.console.print(
@@ -765,13 +1020,17 @@ class AudioProcessor:
                 title="Mic Check", border_style="yellow"
             )
         )
+        calibration_chunk_size = self.capture_rate // 100  # 10 ms of audio
+        # Release the device so the calibration stream doesn't compete with the recording one
+        self._close_stream()
+        
         # Try to open stream with retry logic
         stream = None
         for attempt in range(2):
             try:
                 stream = self._pyaudio.open(
-                    format=pyaudio.paInt16, channels=1, rate=TARGET_SAMPLE_RATE,
-                    input=True, frames_per_buffer=160, input_device_index=self.input_device_index
+                    format=pyaudio.paInt16, channels=1, rate=self.capture_rate,
+                    input=True, frames_per_buffer=calibration_chunk_size, input_device_index=self.input_device_index
                 )
                 break
             except Exception as e:
@@ -785,7 +1044,12 @@ class AudioProcessor:
             raise AudioProcessingError("Failed to open microphone stream")
         
         try:
-            ambient_levels = []
+            level_sum = 0.0
+            level_count = 0
+            # Bound once for the 100-chunk loop
+            read = stream.read
+            compute_level = self.visualizer.compute_level
+            level_scratch = self._level_scratch
             for i in range(100): # 2 seconds of audio
                 try:
                     # Check if stream is still active
@@ -793,9 +1057,9 @@ class AudioProcessor:
                         logging.warning("Audio stream became inactive during calibration")
                         break
                         
-                    audio_chunk = stream.read(160, exception_on_overflow=False)
-                    audio_data = np.frombuffer(audio_chunk, dtype=np.int16)
-                    ambient_levels.append(np.abs(audio_data).mean())
+                    audio_chunk = read(calibration_chunk_size, exception_on_overflow=False)
+                    level_sum += compute_level(audio_chunk, level_scratch)
+                    level_count += 1
                     await asyncio.sleep(0.02)
                 except OSError as e:
                     if e.errno == -9999:  # Unanticipated host error
@@ -815,20 +1079,125 @@ class AudioProcessor:
             except Exception as e:
                 logging.warning(f"Error closing calibration stream: {e}")
         
-        if not ambient_levels:
+        if not level_count:
             self.console.print("[red]Mic calibration failed: No audio data.[/red]")
             return
 
-        avg_noise = np.mean(ambient_levels)
+        avg_noise = level_sum / level_count
         self.config.noise_threshold = int(avg_noise * 2.0) + 25
         self.console.print(f"[green]✓ Calibration complete. New noise threshold: {self.config.noise_threshold}[/green]")
         await asyncio.sleep(2)
 
-    async def record(self) -> Optional[Tuple[bytes, int]]:
-        """Records audio using VAD and provides real-time feedback with robust error handling."""
-        chunk_duration_ms = 20  # VAD supports 10, 20, 30 ms
-        chunk_size = int(TARGET_SAMPLE_RATE * chunk_duration_ms / 1000)
-        
+    def _open_input_stream(self, chunk_size: int) -> "pyaudio.Stream":
+        """Opens a callback-mode input stream that fills the ring buffer."""
+        return self._pyaudio.open(
+            format=pyaudio.paInt16, channels=1, rate=self.capture_rate,
+            input=True, frames_per_buffer=chunk_size, input_device_index=self.input_device_index,
+            stream_callback=self._on_audio
+        )
+
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        """PortAudio callback: copies captured samples into the ring buffer."""
+        samples = np.frombuffer(in_data, dtype=np.int16)
+        ring = self._ring
+        start = self._ring_write % len(ring)
+        end = start + len(samples)
+        if end <= len(ring):
+            ring[start:end] = samples
+        else:
+            split = len(ring) - start
+            ring[start:] = samples[:split]
+            ring[:end - len(ring)] = samples[split:]
+        self._ring_write += len(samples)
+        loop = self._loop
+        if self._armed and loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._audio_ready.set)
+            except RuntimeError:
+                pass  # Event loop already closed
+        return None, pyaudio.paContinue
+
+    def _read_ring(self, position: int, count: int) -> np.ndarray:
+        """Returns `count` samples starting at absolute sample `position`."""
+        ring = self._ring
+        start = position % len(ring)
+        end = start + count
+        if end <= len(ring):
+            return ring[start:end]  # Zero-copy view
+        return np.concatenate((ring[start:], ring[:end - len(ring)]))
+
+    def _install_stop_hooks(self, stop_event: asyncio.Event) -> List[Any]:
+        """Registers key callbacks that set `stop_event` when recording should end."""
+        loop = self._loop
+
+        def request_stop(_event=None):
+            loop.call_soon_threadsafe(stop_event.set)
+
+        if self.config.toggle_recording_mode:
+            # The press that started recording may still be held and auto-repeating,
+            # so only a fresh Alt+X after X has been released stops it
+            x_released = threading.Event()
+
+            def on_x_press(_event):
+                if x_released.is_set() and keyboard.is_pressed("alt"):
+                    request_stop()
+
+            hooks = [
+                keyboard.on_release_key("x", lambda _event: x_released.set()),
+                keyboard.on_press_key("x", on_x_press),
+            ]
+            # Catch a release of the starting tap that happened before the hooks were in place
+            if not keyboard.is_pressed("x"):
+                x_released.set()
+            return hooks
+
+        hooks = [keyboard.on_release_key("x", request_stop), keyboard.on_release_key("alt", request_stop)]
+        # Catch a release that happened before the hooks were in place
+        if not keyboard.is_pressed(KEY_ALT_X):
+            stop_event.set()
+        return hooks
+
+    def _close_stream(self):
+        """Stops and closes the persistent input stream, if one is open."""
+        stream, self._stream = self._stream, None
+        if stream is None:
+            return
+        try:
+            if stream.is_active():
+                stream.stop_stream()
+            stream.close()
+            logging.debug("Audio stream closed successfully")
+        except Exception as e:
+            logging.warning(f"Error closing audio stream: {e}")
+
+    def close(self):
+        """Releases the microphone."""
+        self._armed = False
+        self._close_stream()
+
+    async def aclose(self):
+        """Releases the microphone and shuts down the shared PortAudio instance."""
+        self.close()
+        # Terminate now rather than at interpreter shutdown, when PortAudio may already be torn down
+        await asyncio.to_thread(_terminate_pyaudio)
+        self._pyaudio = None
+
+    async def __aenter__(self) -> "AudioProcessor":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def _ensure_stream(self) -> "pyaudio.Stream":
+        """Returns the persistent input stream, opening it on first use or after a failure."""
+        if self._stream is not None:
+            try:
+                if self._stream.is_active():
+                    return self._stream
+            except Exception as e:
+                logging.warning(f"Audio stream check failed: {e}")
+            self._close_stream()
+
         # Validate input device before attempting to record
         try:
             if self.input_device_index is not None:
@@ -840,6 +1209,10 @@ class AudioProcessor:
             logging.warning(f"Input device validation failed: {e}, using default device")
             self.input_device_index = None
         
+        # Captured samples land in a preallocated ring via the stream callback
+        self._ring = np.zeros(self._chunk_size * (RING_BUFFER_SECONDS * 1000 // VAD_CHUNK_MS), dtype=np.int16)
+        self._ring_write = 0
+        
         # Try to open stream with retry logic and device validation
         stream = None
         for attempt in range(3):  # Increased retry attempts
@@ -851,10 +1224,7 @@ class AudioProcessor:
                         logging.warning(f"Input device {self.input_device_index} has no input channels")
                         self.input_device_index = None
                 
-                stream = self._pyaudio.open(
-                    format=pyaudio.paInt16, channels=1, rate=TARGET_SAMPLE_RATE,
-                    input=True, frames_per_buffer=chunk_size, input_device_index=self.input_device_index
-                )
+                stream = self._open_input_stream(self._chunk_size)
                 
                 # Verify the stream is working
                 if not stream.is_active():
@@ -876,8 +1246,20 @@ class AudioProcessor:
         
         if not stream:
             raise AudioProcessingError("Failed to open recording stream")
+        self._stream = stream
+        return stream
+
+    async def record(self) -> Optional[bytes]:
+        """Records audio using VAD and provides real-time feedback with robust error handling."""
+        chunk_size = self._chunk_size
+        self._loop = asyncio.get_running_loop()
+        # The stream stays open between recordings so starting one doesn't wait on the device
+        stream = self._ensure_stream()
         
-        voiced_frames = []
+        # Voiced audio is written straight into a WAV buffer sized for the longest allowed
+        # recording; the header slot at the front is filled in once the length is known
+        wav = bytearray(WAV_HEADER_SIZE + int(self.config.max_recording_duration * TARGET_SAMPLE_RATE) * PCM16_SAMPLE_SIZE)
+        wav_len = WAV_HEADER_SIZE
         
         try:
             # Wait for key press
@@ -889,13 +1271,41 @@ class AudioProcessor:
                 await asyncio.to_thread(keyboard.wait, KEY_ALT_X)
 
             play_sound(START_SOUND, self.config.enable_sounds)
+            self.capture_idle.clear()
+            self._armed = True
             
             is_recording = True
-            start_time = time.time()
-            alt_x_was_pressed = True  # Track if Alt+X was just pressed to start recording
+            start_time = time.monotonic()
+            stop_requested = asyncio.Event()
+            stop_hooks = []
+            # Transient live line for the level meter; Rich batches redraws and erases it on stop
+            status_line = Live(Text(""), console=self.console, refresh_per_second=10, transient=True)
 
             try:
+                status_line.start()
+                try:
+                    stop_hooks = self._install_stop_hooks(stop_requested)
+                except Exception as e:
+                    logging.error(f"Failed to register recording stop keys: {e}")
+                    stop_requested.set()  # Stop recording if keyboard hooks can't be installed
                 last_update_time = 0
+                last_ui_key = None
+                # Bound once so the per-chunk work skips the attribute lookups
+                vad_is_speech = self.vad.is_speech
+                vad_sample_rate = TARGET_SAMPLE_RATE
+                threshold = self.config.noise_threshold
+                speech_gate = threshold * QUIET_LEVEL_RATIO
+                bucket_scale = 16 / max(1, threshold)
+                max_duration = self.config.max_recording_duration
+                compute_level = self.visualizer.compute_level
+                visualizer = self.visualizer
+                render = visualizer.render
+                level_scratch = self._level_scratch
+                # One resampler per recording so its filter state carries across chunk boundaries
+                resampler = StreamResampler(self.capture_rate) if self.capture_rate != TARGET_SAMPLE_RATE else None
+                pending = bytearray()
+                # Skip audio captured while waiting for the hotkey
+                read_pos = self._ring_write
                 while is_recording:
                     try:
                         # Check if stream is still active before reading
@@ -903,61 +1313,78 @@ class AudioProcessor:
                             logging.warning("Audio stream is no longer active, stopping recording")
                             is_recording = False
                             break
+                        
+                        if len(pending) >= VAD_CHUNK_BYTES:
+                            # Resampled output arrives in uneven bursts; drain it one exact VAD frame at a time
+                            audio_chunk = bytes(pending[:VAD_CHUNK_BYTES])
+                            del pending[:VAD_CHUNK_BYTES]
+                        else:
+                            available = self._ring_write - read_pos
+                            if available < chunk_size:
+                                # Wait for the callback to deliver the next chunk; the timeout
+                                # re-checks the stream in case the device stopped delivering
+                                self._audio_ready.clear()
+                                try:
+                                    await asyncio.wait_for(self._audio_ready.wait(), timeout=0.1)
+                                except asyncio.TimeoutError:
+                                    pass
+                                # Alt+X and the max duration must still end a recording if the device stalls
+                                if stop_requested.is_set() or time.monotonic() - start_time > max_duration:
+                                    is_recording = False
+                                continue
+                            if available > len(self._ring):
+                                logging.warning("Recording loop fell behind audio capture, dropping samples")
+                                read_pos = self._ring_write - chunk_size
                             
-                        audio_chunk = stream.read(chunk_size, exception_on_overflow=False)
-                        audio_level = np.abs(np.frombuffer(audio_chunk, dtype=np.int16)).mean()
+                            samples = self._read_ring(read_pos, chunk_size)
+                            read_pos += chunk_size
+                            if resampler is not None:
+                                # VAD and Whisper both work on TARGET_SAMPLE_RATE audio
+                                pending += resampler.process(samples).tobytes()
+                                continue
+                            audio_chunk = samples.tobytes()
+                        audio_level = compute_level(audio_chunk, level_scratch)
                         
-                        is_speech = self.vad.is_speech(audio_chunk, TARGET_SAMPLE_RATE)
+                        # Cheap energy gate first; only chunks the meter doesn't call "Too Quiet" go to VAD
+                        is_speech = (audio_level >= speech_gate
+                                     and vad_is_speech(audio_chunk, vad_sample_rate))
                         if is_speech:
-                            voiced_frames.append(audio_chunk)
+                            # Slice assignment grows the buffer if the last chunks overshoot it
+                            wav[wav_len:wav_len + len(audio_chunk)] = audio_chunk
+                            wav_len += len(audio_chunk)
                         
                         # Update UI periodically to avoid spam
-                        current_time = time.time()
+                        # One clock read per chunk; monotonic so wall-clock adjustments can't skew it
+                        current_time = time.monotonic()
+                        duration = current_time - start_time
                         if current_time - last_update_time > 0.1:  # Update every 100ms
-                            viz = self.visualizer.render(audio_level, self.config.noise_threshold)
-                            status = "REC" if is_speech else "SILENCE"
-                            duration = current_time - start_time
+                            # Only re-render the bar when the level moves to another 1/16-threshold bucket
+                            # or the peak marker still has to decay (render() moves it one cell per call)
+                            ui_key = (int(audio_level * bucket_scale), is_speech, visualizer.peak_cell)
+                            if ui_key != last_ui_key:
+                                viz = render(audio_level, threshold)
+                                status = "REC" if is_speech else "SILENCE"
+                                last_ui_key = ui_key
                             
-                            # Simple console update without Rich Live
-                            print(f"\r{viz} | Status: {status} | Duration: {duration:.1f}s", end="", flush=True)
+                            status_line.update(Text(f"{viz} | Status: {status} | Duration: {duration:.1f}s"))
                             last_update_time = current_time
 
-                        # Check stop condition
-                        if self.config.toggle_recording_mode:
-                            # In toggle mode, detect Alt+X press to stop
-                            try:
-                                alt_x_currently_pressed = keyboard.is_pressed(KEY_ALT_X)
-                                # If Alt+X is pressed and it wasn't pressed before, toggle recording
-                                if alt_x_currently_pressed and not alt_x_was_pressed:
-                                    is_recording = False
-                                alt_x_was_pressed = alt_x_currently_pressed
-                            except Exception:
-                                pass  # Ignore keyboard errors
-                        else:
-                            # In hold mode, stop when key is released
-                            try:
-                                if not keyboard.is_pressed(KEY_ALT_X):
-                                    is_recording = False
-                            except Exception:
-                                is_recording = False  # Stop recording if keyboard check fails
+                        # Check stop condition (set by the Alt+X key hooks)
+                        if stop_requested.is_set():
+                            is_recording = False
                         
-                        if duration > self.config.max_recording_duration:
+                        if duration > max_duration:
                             break
                         
-                        await asyncio.sleep(0.01)
-                        
                     except OSError as e:
                         if e.errno == -9999:  # Unanticipated host error
                             logging.error(f"Audio device error (host error): {e}")
                             # Try to reinitialize the audio stream
                             try:
-                                stream.stop_stream()
-                                stream.close()
+                                self._close_stream()
                                 logging.info("Attempting to reinitialize audio stream...")
-                                stream = self._pyaudio.open(
-                                    format=pyaudio.paInt16, channels=1, rate=TARGET_SAMPLE_RATE,
-                                    input=True, frames_per_buffer=chunk_size, input_device_index=self.input_device_index
-                                )
+                                stream = self._ensure_stream()
+                                read_pos = self._ring_write
                                 logging.info("Audio stream reinitialized successfully")
                                 continue  # Try recording again
                             except Exception as reinit_error:
@@ -976,60 +1403,170 @@ class AudioProcessor:
             except Exception as e:
                 logging.error(f"Error in recording: {e}", exc_info=True)
             finally:
-                # Clear the line after recording
-                print("\r" + " " * 80 + "\r", end="", flush=True)
+                for hook in stop_hooks:
+                    try:
+                        keyboard.unhook(hook)
+                    except Exception as e:
+                        logging.debug(f"Failed to remove recording stop key hook: {e}")
+                status_line.stop()
 
             play_sound(COMPLETE_SOUND, self.config.enable_sounds)
             
         finally:
-            # Always ensure the stream is properly closed
-            try:
-                if stream:
-                    if stream.is_active():
-                        stream.stop_stream()
-                    stream.close()
-                    logging.debug("Audio stream closed successfully")
-            except Exception as e:
-                logging.warning(f"Error closing audio stream: {e}")
+            # Leave the stream running for the next recording; the callback just stops waking the loop
+            self._armed = False
+            self.capture_idle.set()
 
-        if not voiced_frames or (len(voiced_frames) * chunk_duration_ms / 1000) < self.config.min_recording_duration:
+        voiced_size = wav_len - WAV_HEADER_SIZE
+        if not voiced_size or (voiced_size / VAD_CHUNK_BYTES * VAD_CHUNK_MS / 1000) < self.config.min_recording_duration:
             raise AudioProcessingError("Recording too short or no speech detected.")
             
-        return b"".join(voiced_frames), TARGET_SAMPLE_RATE
-
-    async def save_audio(self, audio_data: bytes, sample_rate: int) -> Path:
-        """Saves audio data to a temporary WAV file."""
-        temp_path = Path(tempfile.gettempdir()) / f"groq_audio_{int(time.time()*1000)}.wav"
-        with wave.open(str(temp_path), "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(self._pyaudio.get_sample_size(pyaudio.paInt16))
-            wf.setframerate(sample_rate)
-            wf.writeframes(audio_data)
-        return temp_path
-
-    def __del__(self):
+        pack_wav_header(wav, voiced_size, TARGET_SAMPLE_RATE)
+        # The upload needs bytes, so this is the only copy of the recording
+        return bytes(memoryview(wav)[:wav_len])
+
+# --- Clipboard & Paste ---
+# Direct Win32 calls: no pyperclip subprocess and no pyautogui key-event pauses on the paste path
+CF_UNICODETEXT = 13
+GMEM_MOVEABLE = 0x0002
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+VK_CONTROL = 0x11
+VK_V = 0x56
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = (("dx", ctypes.wintypes.LONG), ("dy", ctypes.wintypes.LONG),
+                ("mouseData", ctypes.wintypes.DWORD), ("dwFlags", ctypes.wintypes.DWORD),
+                ("time", ctypes.wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t))
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = (("wVk", ctypes.wintypes.WORD), ("wScan", ctypes.wintypes.WORD),
+                ("dwFlags", ctypes.wintypes.DWORD), ("time", ctypes.wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t))
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member, so it must be present for SendInput's size check
+    _fields_ = (("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT))
+
+class _INPUT(ctypes.Structure):
+    _fields_ = (("type", ctypes.wintypes.DWORD), ("union", _INPUTUNION))
+
+@functools.lru_cache(maxsize=1)
+def _win32() -> Optional[Tuple[Any, Any]]:
+    """Returns (user32, kernel32) with prototypes set, or None when not on Windows."""
+    if not hasattr(ctypes, "WinDLL"):
+        return None
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    HANDLE = ctypes.wintypes.HANDLE
+    kernel32.GlobalAlloc.argtypes = (ctypes.wintypes.UINT, ctypes.c_size_t)
+    kernel32.GlobalAlloc.restype = HANDLE
+    kernel32.GlobalLock.argtypes = (HANDLE,)
+    kernel32.GlobalLock.restype = ctypes.c_void_p
+    kernel32.GlobalUnlock.argtypes = (HANDLE,)
+    kernel32.GlobalFree.argtypes = (HANDLE,)
+    kernel32.GlobalFree.restype = HANDLE
+    user32.OpenClipboard.argtypes = (ctypes.wintypes.HWND,)
+    user32.SetClipboardData.argtypes = (ctypes.wintypes.UINT, HANDLE)
+    user32.SetClipboardData.restype = HANDLE
+    user32.SendInput.argtypes = (ctypes.wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int)
+    user32.SendInput.restype = ctypes.wintypes.UINT
+    return user32, kernel32
+
+def _set_clipboard_text(text: str):
+    """Puts `text` on the Windows clipboard as CF_UNICODETEXT."""
+    user32, kernel32 = _win32()
+    data = ctypes.create_unicode_buffer(text)
+    size = ctypes.sizeof(data)
+    handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, size)
+    if not handle:
+        raise ctypes.WinError(ctypes.get_last_error())
+    locked = kernel32.GlobalLock(handle)
+    if not locked:
+        error = ctypes.get_last_error()
+        kernel32.GlobalFree(handle)
+        raise ctypes.WinError(error)
+    ctypes.memmove(locked, data, size)
+    kernel32.GlobalUnlock(handle)
+    
+    # The clipboard can be briefly held by another application
+    for _ in range(5):
+        if user32.OpenClipboard(None):
+            break
+        time.sleep(0.01)
+    else:
+        error = ctypes.get_last_error()
+        kernel32.GlobalFree(handle)
+        raise ctypes.WinError(error)
+    try:
+        if not user32.EmptyClipboard():
+            error = ctypes.get_last_error()
+            kernel32.GlobalFree(handle)
+            raise ctypes.WinError(error)
+        # On success the clipboard owns the memory
+        if not user32.SetClipboardData(CF_UNICODETEXT, handle):
+            error = ctypes.get_last_error()
+            kernel32.GlobalFree(handle)
+            raise ctypes.WinError(error)
+    finally:
+        user32.CloseClipboard()
+
+def _send_ctrl_v():
+    """Injects a Ctrl+V keystroke with a single SendInput call."""
+    user32, _ = _win32()
+    inputs = (_INPUT * 4)()
+    for item, (vk, flags) in zip(inputs, ((VK_CONTROL, 0), (VK_V, 0), (VK_V, KEYEVENTF_KEYUP), (VK_CONTROL, KEYEVENTF_KEYUP))):
+        item.type = INPUT_KEYBOARD
+        item.union.ki = _KEYBDINPUT(wVk=vk, dwFlags=flags)
+    if user32.SendInput(len(inputs), inputs, ctypes.sizeof(_INPUT)) != len(inputs):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+def copy_to_clipboard(text: str):
+    """Copies text to the clipboard, falling back to pyperclip off Windows or on failure."""
+    if _win32() is not None:
         try:
-            if hasattr(self, '_pyaudio') and self._pyaudio:
-                self._pyaudio.terminate()
-        except Exception as e:
-            logging.debug(f"Error terminating PyAudio: {e}")
+            _set_clipboard_text(text)
+            return
+        except OSError as e:
+            logging.debug(f"Win32 clipboard failed, falling back to pyperclip: {e}")
+    pyperclip.copy(text)
+
+def paste_clipboard():
+    """Sends Ctrl+V to the focused window, falling back to pyautogui off Windows or on failure."""
+    if _win32() is not None:
+        try:
+            _send_ctrl_v()
+            return
+        except OSError as e:
+            logging.debug(f"SendInput failed, falling back to pyautogui: {e}")
+    pyautogui.hotkey("ctrl", "v")
 
 # --- Services ---
 class TranscriptionService:
     """Handles communication with the Groq API."""
     def __init__(self, api_key: str):
-        self.client = Groq(api_key=api_key, max_retries=3, timeout=30.0)
-
-    async def transcribe(self, audio_file_path: Path) -> str:
-        with open(audio_file_path, "rb") as audio_file:
-            response = await asyncio.to_thread(
-                self.client.audio.transcriptions.create,
-                file=(audio_file_path.name, audio_file.read()),
-                model="whisper-large-v3",
-                response_format="text"
-            )
+        # One pooled keep-alive connection reused across recordings avoids a TLS handshake per request
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            http2=True
+        )
+        # Native async client, so requests run on the event loop instead of a worker thread
+        self.client = groq.AsyncGroq(api_key=api_key, max_retries=3, timeout=30.0, http_client=self.http_client)
+
+    async def transcribe(self, audio_file: Tuple[str, bytes]) -> str:
+        """Transcribes an in-memory (filename, WAV bytes) upload."""
+        filename, wav_data = audio_file
+        response = await self.client.audio.transcriptions.create(
+            file=(filename, wav_data, "audio/wav"),
+            model="whisper-large-v3",
+            response_format="text"
+        )
         return str(response)
 
+    async def aclose(self):
+        """Closes the pooled HTTP connections."""
+        await self.http_client.aclose()
+
 # --- Main Application ---
 class WhispererApp:
     """Main application orchestrator."""
@@ -1041,6 +1578,12 @@ class WhispererApp:
         self.audio_processor: Optional[AudioProcessor] = None
         self.transcription_service: Optional[TranscriptionService] = None
         self._should_quit = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._key_events: Optional[asyncio.Queue] = None
+        self._transcribe_sem: Optional[asyncio.Semaphore] = None
+        self._quit_requested: Optional[asyncio.Event] = None
+        self._hotkeys: List[Any] = []
+        self._last_hotkey_time = 0.0
         self.skip_config_ui = skip_config_ui
         self.app_logger = logging.getLogger("groq_whisperer")
         self.chat_logger = logging.getLogger("chat")
@@ -1048,12 +1591,19 @@ class WhispererApp:
     async def run(self):
         """Main application entry point."""
         try:
+            self._install_key_hook()
+            # Limits in-flight transcription requests while recording continues
+            self._transcribe_sem = asyncio.Semaphore(4)
+            self._quit_requested = asyncio.Event()
+            
             is_first_run = not CONFIG_FILE.exists()
             if is_first_run:
                 await self.first_run_setup()
-            
-            self.config = Config.load() # Reload config after potential first run setup
-            self.settings_ui.config = self.config
+                # Reload config saved by first run setup; otherwise __init__ already loaded it
+                self.config = Config.load()
+                self.settings_ui.config = self.config
+                if self.audio_processor:
+                    self.audio_processor.config = self.config
             
             # Initialize logging with user settings
             setup_logging(
@@ -1097,8 +1647,42 @@ class WhispererApp:
             ))
             logging.exception("Unexpected error during execution")
         finally:
+            self._unregister_hotkeys()
+            if self.audio_processor:
+                await self.audio_processor.aclose()
+            if self.transcription_service:
+                try:
+                    await self.transcription_service.aclose()
+                except Exception as e:
+                    logging.debug(f"Failed to close HTTP client: {e}")
             self.config.save()
 
+    def _install_key_hook(self):
+        """Installs a single global keyboard hook that feeds key events to the UI."""
+        self._loop = asyncio.get_running_loop()
+        keyboard.hook(self._on_key_event)
+
+    def _on_key_event(self, event: keyboard.KeyboardEvent):
+        """Keyboard listener thread callback; forwards events only while a consumer is active."""
+        key_events = self._key_events
+        if key_events is not None:
+            self._loop.call_soon_threadsafe(key_events.put_nowait, event)
+
+    @asynccontextmanager
+    async def capture_key_events(self):
+        """Yields a queue receiving global key events for the duration of the block."""
+        self._key_events = asyncio.Queue()
+        try:
+            yield self._key_events
+        finally:
+            self._key_events = None
+
+    def discard_key_events(self):
+        """Drops key events queued so far, e.g. keystrokes typed into a prompt."""
+        if self._key_events is not None:
+            while not self._key_events.empty():
+                self._key_events.get_nowait()
+
     async def first_run_setup(self):
         """Guides the user through initial setup."""
         self.console.print(Panel("[bold cyan]Welcome to Groq Whisperer! Let's get you set up.[/bold cyan]"))
@@ -1123,6 +1707,7 @@ class WhispererApp:
         
         await self.initialize_audio()
         self.transcription_service = TranscriptionService(api_key)
+        self._register_hotkeys()
 
     def _show_startup_banner(self):
         """Displays the ready message."""
@@ -1138,79 +1723,103 @@ class WhispererApp:
         ))
 
     async def _keyboard_listener(self):
-        """Listen for global keyboard shortcuts."""
-        while not self._should_quit:
+        """Waits until the Alt+Q shortcut asks the app to quit."""
+        await self._quit_requested.wait()
+
+    def _register_hotkeys(self):
+        """Registers the global Alt+T / Alt+Q shortcuts; callbacks run on the event loop."""
+        loop = self._loop
+        self._hotkeys = [
+            keyboard.add_hotkey(KEY_ALT_T, lambda: loop.call_soon_threadsafe(self._toggle_recording_mode)),
+            keyboard.add_hotkey(KEY_ALT_Q, lambda: loop.call_soon_threadsafe(self._request_quit)),
+        ]
+
+    def _unregister_hotkeys(self):
+        """Removes the shortcuts registered by _register_hotkeys."""
+        for hotkey in self._hotkeys:
             try:
-                # Use keyboard.wait for the specific hotkey combinations
-                # This is more reliable than reading individual events
-                await asyncio.to_thread(self._check_hotkeys)
-                await asyncio.sleep(0.05)  # Check every 50ms
-                
+                keyboard.remove_hotkey(hotkey)
             except Exception as e:
-                logging.debug(f"Keyboard listener error: {e}")
-                await asyncio.sleep(0.1)  # Longer delay on error
-    
-    def _check_hotkeys(self):
-        """Check for hotkey combinations."""
+                logging.debug(f"Failed to remove hotkey: {e}")
+        self._hotkeys = []
+
+    def _toggle_recording_mode(self):
+        """Alt+T: switches between hold and toggle recording."""
+        # Prevent rapid toggling while the keys are held
+        now = time.monotonic()
+        if now - self._last_hotkey_time < 0.3:
+            return
+        self._last_hotkey_time = now
+        self.config.toggle_recording_mode = not self.config.toggle_recording_mode
+        self.config.save()
+        mode = "Toggle" if self.config.toggle_recording_mode else "Hold"
+        self.console.print(f"\n[yellow]Recording mode changed to: {mode}[/yellow]")
+
+    def _request_quit(self):
+        """Alt+Q: stops the main loop."""
+        if self._should_quit:
+            return
+        self.console.print("\n[yellow]Quitting...[/yellow]")
+        self._should_quit = True
+        self._quit_requested.set()
+
+    async def _transcribe_one(self, audio_file: Tuple[str, bytes]) -> str:
+        """Transcribes one recording, bounded by the in-flight request limit."""
+        async with self._transcribe_sem:
+            return await self.transcription_service.transcribe(audio_file)
+
+    async def _transcribe_and_deliver(self, audio_file: Tuple[str, bytes], previous: Optional[asyncio.Task]):
+        """Transcribes a recording in the background and outputs it in recording order."""
         try:
-            # Add a small flag to prevent multiple rapid triggers
-            if hasattr(self, '_last_hotkey_time'):
-                if time.time() - self._last_hotkey_time < 0.3:
-                    return
+            transcription = await self._transcribe_one(audio_file)
             
-            # Check Alt+T (toggle recording mode)
-            if keyboard.is_pressed('alt') and keyboard.is_pressed('t'):
-                self.config.toggle_recording_mode = not self.config.toggle_recording_mode
-                self.config.save()
-                mode = "Toggle" if self.config.toggle_recording_mode else "Hold"
-                self.console.print(f"\n[yellow]Recording mode changed to: {mode}[/yellow]")
-                self._last_hotkey_time = time.time()
-                time.sleep(0.3)  # Prevent rapid toggling
+            # Keep output in order and never paste while the hotkey is held for the next recording
+            if previous is not None:
+                await previous
+            await self.audio_processor.capture_idle.wait()
             
-            # Check Alt+Q (quit)
-            elif keyboard.is_pressed('alt') and keyboard.is_pressed('q'):
-                self.console.print("\n[yellow]Quitting...[/yellow]")
-                self._should_quit = True
-                self._last_hotkey_time = time.time()
-                
+            self.console.print(Panel(Text(transcription), title="Transcription", border_style="green"))
+            copy_to_clipboard(transcription)
+            self.console.print("[cyan]✓ Copied to clipboard.[/cyan]")
+            
+            # Log transcription to chat log
+            if self.config.enable_session_logging:
+                self.chat_logger.info(f"TRANSCRIPTION: {transcription}")
+            
+            if self.config.auto_paste:
+                paste_clipboard()
+                self.console.print("[cyan]✓ Pasted.[/cyan]")
+                play_sound(COMPLETE_SOUND, self.config.enable_sounds)
+        
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logging.debug(f"Hotkey check error: {e}")
+            logging.error(f"Transcription failed: {e}", exc_info=True)
+            self.console.print(Panel(
+                str(e),
+                title="[red]Error[/red]",
+                border_style="red"
+            ))
 
     async def _main_loop(self):
         """The main record-transcribe loop."""
+        previous_delivery: Optional[asyncio.Task] = None
         while not self._should_quit:
             try:
                 if not self.audio_processor or not self.transcription_service:
                     raise RuntimeError("Services not initialized.")
 
-                audio_data, sample_rate = await self.audio_processor.record()
-                if not audio_data:
+                wav_data = await self.audio_processor.record()
+                if not wav_data:
                     continue
 
-                with self.console.status("[bold green]Saving audio...[/]"):
-                    temp_audio_file = await self.audio_processor.save_audio(audio_data, sample_rate)
-
-                with self.console.status("[bold green]Transcribing...[/]"):
-                    transcription = await self.transcription_service.transcribe(temp_audio_file)
-                
-                self.console.print(Panel(Text(transcription), title="Transcription", border_style="green"))
-                pyperclip.copy(transcription)
-                self.console.print("[cyan]✓ Copied to clipboard.[/cyan]")
-                
-                # Log transcription to chat log
-                if self.config.enable_session_logging:
-                    self.chat_logger.info(f"TRANSCRIPTION: {transcription}")
-                
-                if self.config.auto_paste:
-                    pyautogui.hotkey("ctrl", "v")
-                    self.console.print("[cyan]✓ Pasted.[/cyan]")
-                    play_sound(COMPLETE_SOUND, self.config.enable_sounds)
+                audio_file = ("audio.wav", wav_data)
 
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_audio_file)
-                except Exception as e:
-                    logging.warning(f"Could not delete temporary file {temp_audio_file}: {e}")
+                # Transcribe in the background so the next recording can start right away
+                self.console.print("[bold green]Transcribing...[/]")
+                previous_delivery = asyncio.create_task(
+                    self._transcribe_and_deliver(audio_file, previous_delivery)
+                )
 
             except AudioProcessingError as e:
                 # Clear console and show single error message to prevent waterfall
@@ -29,12 +29,12 @@ def main():
         rp("[bold yellow]⚠️  Only Windows is fully supported. Good luck![/bold yellow]")
     
     # Check if the main application file exists
-    main_script = Path(__file__).parent / "groq3new-Copy.py"
+    main_script = Path(__file__).parent / "groq3new.py"
     if not main_script.exists():
         console.print(Panel(
             "[bold red]❌ Main application file not found![/bold red]\n"
             f"Expected: {main_script}\n"
-            "Please ensure groq3new-Copy.py is in the same directory.",
+            "Please ensure groq3new.py is in the same directory.",
             title="Launch Error",
             border_style="red"
         ))
@@ -50,11 +50,8 @@ def main():
     ))
     
     try:
-        # Import and run the main application
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("groq_app", main_script)
-        groq_app = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(groq_app)
+        # Import and run the main application; a regular import reuses the cached bytecode
+        import groq3new as groq_app
         
         # Run the main function
         if hasattr(groq_app, 'main'):